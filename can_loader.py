@@ -1,20 +1,495 @@
 import pandas as pd
 import cantools
 import numpy as np
-import random
 import can
 import os
+import re
+import mmap
+from collections import OrderedDict
+import functools
+import hashlib
+import pickle
+import sys
+
+# Payload bytes per row of CANLoader.data_bytes (classic CAN); longer CAN FD payloads widen it
+DATA_WIDTH = 8
+
+# Column dtypes of CANLoader.df: CAN IDs fit in 29 bits, DLC is at most 64 (CAN FD)
+FRAME_DTYPES = {'Timestamp': 'float64', 'ID': 'uint32', 'DLC': 'uint8', 'Channel': 'category'}
+
+# Max entries of each decode cache (per-frame dicts and UI strings)
+DECODE_CACHE_SIZE = 100_000
+
+# CSV logs: common column name variations (after strip().lower())
+CSV_COLUMN_MAP = {
+    'time': 'Timestamp', 'timestamp': 'Timestamp',
+    'id': 'ID', 'can_id': 'ID', 'identifier': 'ID',
+    'dlc': 'DLC', 'len': 'DLC', 'length': 'DLC',
+    'data': 'Data', 'payload': 'Data'
+}
+# CSV columns with a dtype known up front (mapped name -> dtype)
+CSV_READ_DTYPES = {'Timestamp': 'float64', 'DLC': 'uint8', 'Data': str}
+# CSV logs bigger than this are read in chunks of CSV_CHUNK_ROWS rows
+CSV_CHUNK_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 500_000
+
+# python-can readers fed with a read-ahead file object: {ext: (reader, open mode)},
+# one for every format _load_can_log is used for
+PREFETCH_READERS = {
+    '.asc': (can.ASCReader, 'r'),
+    '.blf': (can.BLFReader, 'rb'),
+    '.log': (can.CanutilsLogReader, 'r'),
+}
+READ_BUFFER_SIZE = 1024 * 1024
+
+def _user_cache_dir():
+    """Per-user cache folder of the app, following each platform's convention."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'OpenCANalyzer')
+
+# Parsed DBC databases are pickled here. Pickles can run code when loaded, so
+# they are only ever read from this app-owned folder, never from next to a DBC
+DBC_CACHE_DIR = _user_cache_dir()
+
+# Parsed logs are cached next to the source (needs pyarrow): the frame columns
+# as <log>.cache.parquet, the payload array as <log>.cache.npy
+LOG_CACHE_SUFFIX = '.cache'
+# Bump when the cached layout changes, older caches are then ignored
+LOG_CACHE_VERSION = 1
+
+# Regex-parsed logs are scanned and split in blocks of about this many bytes,
+# so the per-line temporaries stay small whatever the log size
+PARSE_BLOCK_BYTES = 256 * 1024
+
+# BusMaster frame line: Time Tx/Rx Channel ID Type DLC Data...
+# Ex: 17:48:32:9099 Rx 1 0x004 s 8 04 08 ...
+# No groups: matches are whole lines, split into fields by _split_tokens
+# (Tx/Rx and type tokens are any bytes above ' ', the token characters there)
+_BUSMASTER_RE = re.compile(
+    rb'^\d+:\d+:\d+:\d+[ \t]+[!-\xff]+[ \t]+\d+[ \t]+(?:0x)?[0-9A-Fa-f]{1,8}[ \t]+[!-\xff]+[ \t]+'
+    rb'\d+(?:[ \t]+[0-9A-Fa-f]{2})*[ \t]*\r?$',
+    re.MULTILINE)
+
+# Vector ASC classic data frame (hex base), the only kind read by the fast path
+# Ex:  0.001000 2  101             Rx   d 8 7E C1 83 47 1F 9F 89 5C  Length = 0 ...
+# No groups: matches end after the data bytes and are split by _split_tokens
+_ASC_FRAME_RE = re.compile(
+    rb'^[ \t]*\d+\.\d+[ \t]+\d+[ \t]+[0-9A-Fa-f]{1,8}x?[ \t]+(?:Tx|Rx)[ \t]+d[ \t]+'
+    rb'[0-9A-Fa-f](?![^ \t\r\n])(?:[ \t]+[0-9A-Fa-f]{2}(?![^ \t\r\n]))*',
+    re.MULTILINE | re.IGNORECASE)
+# Every line python-can's ASCReader turns into a message (data, remote, error, CAN FD)
+_ASC_ANY_FRAME_RE = re.compile(
+    rb'^[ \t]*\d+\.\d+[ \t]+(?:\d+[ \t]+(?:\w+[ \t]+(?:Tx|Rx)|ErrorFrame)|CANFD)',
+    re.MULTILINE | re.IGNORECASE)
+_ASC_BASE_DEC_RE = re.compile(rb'^[ \t]*base[ \t]+dec', re.MULTILINE | re.IGNORECASE)
+# ASC headers are a few lines; only this much of the file is checked for the base
+ASC_HEADER_BYTES = 64 * 1024
+
+# Payload length of each DLC code (CAN FD codes above 8), like can.util.dlc2len
+_DLC_LEN = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 16, 20, 24, 32, 48, 64], dtype=np.uint8)
+
+# Value of every ASCII hex digit, indexed by character code
+_HEX_NIBBLE = np.zeros(256, dtype=np.uint8)
+for _i, _c in enumerate(b'0123456789abcdef'):
+    _HEX_NIBBLE[_c] = _HEX_NIBBLE[ord(chr(_c).upper())] = _i
+
+# Byte value of every two-digit hex pair, indexed by (first char << 8) | second char
+_HEX_PAIR = ((_HEX_NIBBLE[:, None] << 4) | _HEX_NIBBLE[None, :]).ravel()
+
+def _hex_chars_to_u8(chars):
+    """Converts a C-contiguous (N, 2k) array of ASCII hex digit codes into (N, k) uint8 bytes."""
+    # Each digit pair read as one big-endian uint16 is its index into _HEX_PAIR
+    return _HEX_PAIR[chars.view('>u2')]
+
+def _hex_column_to_u8(hex_strings, width):
+    """Converts a bytes array (dtype S) of hex digits into (N, width) uint8, zero padded."""
+    if len(hex_strings) == 0:
+        return np.zeros((0, width), dtype=np.uint8)
+    padded = np.char.ljust(hex_strings, 2 * width, b'0')
+    return _hex_chars_to_u8(padded.view(np.uint8).reshape(len(padded), 2 * width))
+
+def _split_tokens(lines):
+    """
+    Splits regex-validated log lines (a list of bytes) into tokens in one
+    NumPy pass; token characters are the bytes above ' ', so blanks and CR
+    separate them. Returns (chars, starts, ends, first, count): chars is the
+    flat uint8 buffer of the lines, each zero padded to the same length;
+    starts/ends hold the [start, end) position in chars of every token, in
+    line order; line i has count[i] tokens, the first at index first[i].
+    """
+    width = max(map(len, lines)) + 1 # Every line ends with at least one pad byte
+    chars = np.array(lines, dtype=f'S{width}').view(np.uint8)
+    # Token starts and ends alternate where the text mask flips
+    edges = np.diff(chars > ord(' '), prepend=False)
+    positions = np.flatnonzero(edges)
+    count = np.count_nonzero(edges.reshape(len(lines), width), axis=1) // 2
+    return chars, positions[0::2], positions[1::2], np.cumsum(count) - count, count
+
+def _token_chars(chars, starts, ends, width):
+    """
+    Chars of one token per line as a (N, width) array, right aligned and
+    padded with '0', so decimal and hex tokens keep their value.
+    """
+    pos = ends[:, None] + np.arange(-width, 0)
+    out = chars[pos]
+    out[pos < starts[:, None]] = ord('0')
+    return out
+
+def _decimal_tokens(chars, starts, ends):
+    """Values of one decimal token per line as int64."""
+    digits = _token_chars(chars, starts, ends, int((ends - starts).max())) - ord('0')
+    value = np.zeros(len(starts), dtype=np.int64)
+    for column in digits.T:
+        value = value * 10 + column
+    return value
+
+def _hex_ids_to_u32(chars, starts, ends):
+    """CAN IDs from one hex token (at most 8 digits, no prefix) per line."""
+    return _hex_chars_to_u8(_token_chars(chars, starts, ends, 8)).view('>u4').ravel().astype(np.uint32)
+
+def _hex_payloads_to_u8(chars, starts, first, count, dlc, width):
+    """
+    Builds the (N, width) payload array from two-digit hex byte tokens: line
+    i has count[i] of them, the first at index first[i] of starts. Bytes past
+    the DLC stay zero.
+    """
+    k = np.arange(width)
+    valid = k < np.minimum(count, dlc)[:, None]
+    pos = starts[np.where(valid, first[:, None] + k, 0)]
+    data = _HEX_PAIR[(chars[pos].astype(np.uint16) << 8) | chars[pos + 1]]
+    data[~valid] = 0
+    return data
+
+def _concat_payloads(payloads):
+    """Stacks (N, width) payload arrays, zero padding the narrower ones to the widest."""
+    width = max(p.shape[1] for p in payloads)
+    return np.concatenate([np.pad(p, ((0, 0), (0, width - p.shape[1]))) for p in payloads])
+
+def _concat_blocks(blocks):
+    """Joins per-block column tuples, payload arrays last, into whole-log columns."""
+    *columns, payloads = zip(*blocks)
+    return [np.concatenate(col) for col in columns] + [_concat_payloads(payloads)]
+
+def _find_lines(mm, pattern):
+    """
+    Yields the matches of a re.MULTILINE pattern in a memory-mapped log, one
+    list per block of about PARSE_BLOCK_BYTES (blocks end at line breaks).
+    """
+    pos, size = 0, len(mm)
+    while pos < size:
+        end = mm.find(b'\n', pos + PARSE_BLOCK_BYTES)
+        end = size if end < 0 else end + 1
+        lines = pattern.findall(mm, pos, end)
+        if lines:
+            yield lines
+        pos = end
+
+def _parse_busmaster_lines(lines):
+    """
+    Splits BusMaster frame lines (matches of _BUSMASTER_RE) into columns:
+    (seconds since midnight, channel, ID, DLC, (N, width) payload bytes).
+    """
+    # Tokens: Time Tx/Rx Channel ID Type DLC Data...
+    chars, starts, ends, first, count = _split_tokens(lines)
+    n = len(lines)
+
+    # Parse Time HH:MM:SS:mmmm, split at the three colons of the first token
+    time_start, time_end = starts[first], ends[first]
+    time_width = int((time_end - time_start).max())
+    colons = np.nonzero(_token_chars(chars, time_start, time_end, time_width) == ord(':'))[1]
+    colons = time_end[:, None] - time_width + colons.reshape(n, 3)
+    h = _decimal_tokens(chars, time_start, colons[:, 0])
+    m = _decimal_tokens(chars, colons[:, 0] + 1, colons[:, 1])
+    s = _decimal_tokens(chars, colons[:, 1] + 1, colons[:, 2])
+    ms = _decimal_tokens(chars, colons[:, 2] + 1, time_end)
+    # ms is usually in 0.1ms units (0-9999): 9099 -> 909.9ms
+    seconds = h * 3600 + m * 60 + s + ms / 10000.0
+
+    channel = _decimal_tokens(chars, starts[first + 2], ends[first + 2])
+    # Skip the optional '0x' of the ID ('x' is no hex digit, so it can only be the prefix)
+    id_start = starts[first + 3]
+    id_start = id_start + 2 * (chars[id_start + 1] == ord('x'))
+    can_id = _hex_ids_to_u32(chars, id_start, ends[first + 3])
+    dlc = _decimal_tokens(chars, starts[first + 5], ends[first + 5]).astype(np.uint8)
+
+    # Data bytes: the tokens after the DLC, zero past the DLC
+    count -= 6
+    width = max(DATA_WIDTH, int(count.max()))
+    return seconds, channel, can_id, dlc, _hex_payloads_to_u8(chars, starts, first + 6, count, dlc, width)
+
+def _parse_asc_lines(lines):
+    """
+    Splits ASC data frame lines (matches of _ASC_FRAME_RE) into columns:
+    (timestamp, channel, ID, DLC, (N, DATA_WIDTH) payload bytes).
+    """
+    # Tokens: Time Channel ID[x] Tx/Rx d DLC Data...
+    chars, starts, ends, first, count = _split_tokens(lines)
+
+    # Timestamps go through NumPy's float parser as fixed-width strings
+    ts_start, ts_end = starts[first], ends[first]
+    ts_width = int((ts_end - ts_start).max())
+    ts = _token_chars(chars, ts_start, ts_end, ts_width).view(f'S{ts_width}').ravel().astype(np.float64)
+
+    # ASC channels count from 1, python-can's from 0
+    channel = _decimal_tokens(chars, starts[first + 1], ends[first + 1]) - 1
+    # Extended IDs end with an 'x'
+    id_end = ends[first + 2]
+    last = chars[id_end - 1]
+    id_end = id_end - ((last == ord('x')) | (last == ord('X')))
+    can_id = _hex_ids_to_u32(chars, starts[first + 2], id_end)
+    dlc = _DLC_LEN[_HEX_NIBBLE[chars[starts[first + 5]]]]
+
+    # Classic frames carry at most 8 data bytes; bytes past the DLC are zeroed
+    count -= 6
+    return ts, channel, can_id, dlc, _hex_payloads_to_u8(chars, starts, first + 6, count, dlc, DATA_WIDTH)
+
+def _with_frame_dtypes(df):
+    """Casts the frame columns present in df to FRAME_DTYPES."""
+    return df.astype({c: t for c, t in FRAME_DTYPES.items() if c in df.columns})
+
+def _read_csv(filepath, dtypes):
+    """Reads a CSV log with the pyarrow engine when it is installed."""
+    try:
+        return pd.read_csv(filepath, engine='pyarrow', dtype=dtypes)
+    except (ImportError, ValueError):
+        return pd.read_csv(filepath, engine='c', dtype=dtypes, low_memory=False)
+
+def _parse_ids(ids):
+    """Converts a CSV ID column to int64; '0x' prefixed entries are hex, others decimal."""
+    if pd.api.types.is_numeric_dtype(ids):
+        return ids.to_numpy(dtype=np.int64)
+
+    ids = ids.astype(str).str.strip()
+    is_hex = ids.str.contains('x', case=False, regex=False).to_numpy()
+    out = np.empty(len(ids), dtype=np.int64)
+    out[~is_hex] = pd.to_numeric(ids[~is_hex]).to_numpy(dtype=np.int64)
+    out[is_hex] = ids[is_hex].map(functools.partial(int, base=16)).to_numpy(dtype=np.int64)
+    return out
+
+def _decode_or_none(message, payload):
+    """Decodes a payload with a cantools message, None if it does not decode."""
+    # Explicit checks instead of catching cantools errors on every frame
+    if len(payload) < message.length:
+        return None
+    if message.is_multiplexed():
+        # Unknown multiplexer values are the only failure left after the length check
+        try:
+            return message.decode(payload)
+        except Exception:
+            return None
+    return message.decode(payload)
+
+def _hex_to_u8(hex_strings):
+    """
+    Converts hex payload strings into a (N, width) uint8 array, zero padded on
+    the right. The width is DATA_WIDTH or the longest payload (CAN FD).
+    Non-hex characters decode as 0.
+    """
+    hex_strings = pd.Series(hex_strings, dtype=object).fillna('').astype(str)
+    hex_strings = hex_strings.str.replace(' ', '', regex=False)
+    lengths = hex_strings.str.len().to_numpy()
+    hex_strings = hex_strings.where(lengths % 2 == 0, '0' + hex_strings)
+    width = max(DATA_WIDTH, (int(lengths.max()) + 1) // 2) if len(lengths) else DATA_WIDTH
+
+    # Fixed-width ASCII view of the whole column, decoded in one pass
+    # through the hex digit lookup table
+    chars = hex_strings.str.encode('ascii', 'replace').to_numpy(dtype='S')
+    return _hex_column_to_u8(chars, width)
+
+# Cache miss marker, None is a valid cached decode result
+_MISSING = object()
+
+class _LRUCache(OrderedDict):
+    """Dict bounded to maxsize entries, evicting the least recently used one."""
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+def _compile_signal_extractor(signal):
+    """
+    Builds extract(data_u8) -> float64 physical values of 'signal' for every
+    row of a (N, width) uint8 payload array, using vectorized bit shifts
+    instead of decoding each frame with cantools.
+    Returns None for signals that need cantools (float or multiplexed).
+    """
+    if signal.is_float or signal.multiplexer_ids:
+        return None
+
+    length = signal.length
+    if signal.byte_order == 'little_endian':
+        lsb = signal.start
+        first_byte, last_byte = lsb // 8, (lsb + length - 1) // 8
+        shift = lsb % 8
+        # Byte k of the span lands at bit 8*k of the raw value
+        byte_shifts = [8 * k for k in range(last_byte - first_byte + 1)]
+    else:
+        # DBC big endian start bit is the MSB in sawtooth numbering;
+        # convert it to a linear bit position counted from byte 0, bit 7
+        msb = (signal.start // 8) * 8 + (7 - signal.start % 8)
+        lsb = msb + length - 1
+        first_byte, last_byte = msb // 8, lsb // 8
+        shift = 7 - lsb % 8
+        byte_shifts = [8 * k for k in reversed(range(last_byte - first_byte + 1))]
+
+    if len(byte_shifts) > 8:
+        # Spans 9 bytes, does not fit the 64 bit accumulator
+        return None
+
+    mask = np.uint64((1 << length) - 1)
+    # Signed values are sign extended in 64 bits: sign bit up to bit 63, arithmetic shift back
+    sign_shift = 64 - length
+    scale, offset = float(signal.scale), float(signal.offset)
+
+    def extract(data_u8):
+        if data_u8.shape[1] <= last_byte:
+            data_u8 = np.pad(data_u8, ((0, 0), (0, last_byte + 1 - data_u8.shape[1])))
+        raw = np.zeros(len(data_u8), dtype=np.uint64)
+        for k, byte_shift in enumerate(byte_shifts):
+            raw |= data_u8[:, first_byte + k].astype(np.uint64) << np.uint64(byte_shift)
+        raw = (raw >> np.uint64(shift)) & mask
+
+        if signal.is_signed:
+            raw = (raw << np.uint64(sign_shift)).view(np.int64) >> np.int64(sign_shift)
+        elif length < 64:
+            raw = raw.view(np.int64)
+        return raw * scale + offset
+
+    return extract
+
+def _open_prefetched(filepath, mode):
+    """
+    Opens a log for a single sequential pass: large buffer, and on systems with
+    posix_fadvise the access is declared sequential, so the kernel reads ahead
+    further while the current frames are decoded (without pulling the whole
+    file into the page cache up front).
+    """
+    f = open(filepath, mode, buffering=READ_BUFFER_SIZE)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
+def _log_cache_key(st):
+    """Cache key of a log file from its os.stat result."""
+    return f"{st.st_mtime_ns}:{st.st_size}:{LOG_CACHE_VERSION}".encode()
+
+def _read_log_cache(filepath, key):
+    """
+    Returns (df, data_bytes) from the log's cache, or None if there is no
+    valid cache. The parquet file is memory-mapped and the payload array is
+    opened read-only with np.load(mmap_mode='r'), so nothing is parsed.
+    """
+    base = filepath + LOG_CACHE_SUFFIX
+    try:
+        import pyarrow.parquet as pq
+        metadata = pq.read_schema(base + '.parquet').metadata or {}
+        if metadata.get(b'opencanalyzer') != key:
+            return None
+        df = pq.read_table(base + '.parquet', memory_map=True).to_pandas()
+        data_bytes = np.load(base + '.npy', mmap_mode='r')
+    except Exception:
+        # No pyarrow, missing or unreadable cache: parse the log instead
+        return None
+    if data_bytes.ndim != 2 or len(data_bytes) != len(df):
+        return None
+    return _with_frame_dtypes(df), data_bytes
+
+def _write_log_cache(filepath, key, df, data_bytes):
+    """Writes the log cache read by _read_log_cache; skipped without pyarrow or on write errors."""
+    base = filepath + LOG_CACHE_SUFFIX
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'opencanalyzer': key})
+        # Written to temporary names and renamed: a cache that is still
+        # memory-mapped by a previous load keeps its old file
+        with open(base + '.npy.tmp', 'wb') as f:
+            np.save(f, np.ascontiguousarray(data_bytes))
+        pq.write_table(table, base + '.parquet.tmp', compression='zstd')
+        os.replace(base + '.npy.tmp', base + '.npy')
+        os.replace(base + '.parquet.tmp', base + '.parquet')
+    except (ImportError, OSError, TypeError, ValueError):
+        # No pyarrow, read-only folder, or a frame pyarrow cannot convert
+        pass
+
+def _dbc_cache_path(filepath):
+    """Pickle file in DBC_CACHE_DIR for a DBC, named by a hash of its path, contents and the cantools version."""
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(filepath)) + b'\0')
+    with open(filepath, 'rb') as f:
+        digest.update(f.read())
+    digest.update(cantools.__version__.encode())
+    return os.path.join(DBC_CACHE_DIR, digest.hexdigest() + '.pkl')
+
+@functools.lru_cache(maxsize=16)
+def _load_dbc_cached(filepath, mtime_ns, size):
+    """
+    Parses a DBC file once per (path, mtime, size).
+    The parsed database is also pickled to DBC_CACHE_DIR, which is much
+    faster to load than re-parsing the text on the next start.
+    """
+    cache_path = _dbc_cache_path(filepath)
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache: parse the DBC instead
+        pass
+
+    db = cantools.database.load_file(filepath)
+    try:
+        os.makedirs(DBC_CACHE_DIR, exist_ok=True)
+        # Written under a temporary name, so a crash never leaves half a pickle
+        with open(cache_path + '.tmp', 'wb') as f:
+            pickle.dump(db, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + '.tmp', cache_path)
+    except OSError:
+        pass
+    return db
 
 class CANLoader:
     def __init__(self):
         self.db = None
-        self.df = pd.DataFrame(columns=['Timestamp', 'ID', 'Data', 'Channel', 'DLC'])
-        self.decoded_cache = {} # Cache for decoded messages to speed up playback/display
+        self._msg_by_id = {}    # {frame_id: cantools Message}, built once per DBC
+        self._extractors = {}   # {(frame_id, signal_name): extract function or None}
+        self._id_index = {}     # {can_id: sorted row indices of that ID}
+        self.id_codes = np.zeros(0, dtype=np.intp) # Per-frame ID code: position of its ID in id_uniques
+        self.id_uniques = np.zeros(0, dtype=np.uint32)
+        self.df = _with_frame_dtypes(pd.DataFrame(columns=['Timestamp', 'ID', 'Channel', 'DLC']))
+        self.data_bytes = np.zeros((0, DATA_WIDTH), dtype=np.uint8) # Raw payloads, one row per frame
+        # Decode caches, keyed by frame index: signal dicts (shared by the list
+        # view and plotting) and the formatted strings shown in the UI
+        self._decoded_dict_cache = _LRUCache(DECODE_CACHE_SIZE)
+        self._decoded_str_cache = _LRUCache(DECODE_CACHE_SIZE)
+        self._trace_cache = {}  # {(can_id, signal_name): (times, float32 values)}
 
     def load_dbc(self, filepath):
         """Loads a DBC file using cantools."""
         try:
-            self.db = cantools.database.load_file(filepath)
+            st = os.stat(filepath)
+            self.db = _load_dbc_cached(filepath, st.st_mtime_ns, st.st_size)
+            self._msg_by_id = {m.frame_id: m for m in self.db.messages}
+            self._extractors = {}
+            self._clear_decode_caches()
             print(f"Loaded DBC: {filepath}")
             return True
         except Exception as e:
@@ -25,202 +500,249 @@ class CANLoader:
         """
         Loads a log file. 
         Supports CSV, ASC, and LOG formats.
+        Parsed logs are cached next to the file (see LOG_CACHE_SUFFIX), so
+        opening an unchanged log again skips parsing.
         """
-        ext = os.path.splitext(filepath)[1].lower()
-        
         try:
-            # Check for BusMaster specifically
-            if ext == '.log':
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    header = f.readline()
-                    if header.startswith('***BUSMASTER'):
-                        return self._load_busmaster(filepath)
-
-            if ext == '.csv':
-                return self._load_csv(filepath)
-            elif ext in ['.asc', '.log', '.blf']:
-                return self._load_can_log(filepath)
-            else:
-                print(f"Unsupported file extension: {ext}")
+            cache_key = _log_cache_key(os.stat(filepath))
+            cached = _read_log_cache(filepath, cache_key)
+            if cached is not None:
+                self.df, self.data_bytes = cached
+                self._frames_loaded()
+                print(f"Loaded Log ({filepath}): {len(self.df)} frames (cached)")
+                return True
+
+            if not self._parse_log(filepath):
                 return False
         except Exception as e:
             print(f"Error loading Log: {e}")
             return False
 
+        _write_log_cache(filepath, cache_key, self.df, self.data_bytes)
+        return True
+
+    def _parse_log(self, filepath):
+        """Parses a log file with the loader matching its format."""
+        ext = os.path.splitext(filepath)[1].lower()
+        
+        # Check for BusMaster specifically
+        if ext == '.log':
+            with open(filepath, 'rb') as f:
+                head = f.read(16)
+            if head.startswith(b'***BUSMASTER'):
+                return self._load_busmaster(filepath)
+
+        if ext == '.csv':
+            return self._load_csv(filepath)
+        elif ext == '.asc' and self._load_asc_fast(filepath):
+            return True
+        elif ext in ['.asc', '.log', '.blf']:
+            return self._load_can_log(filepath)
+        else:
+            print(f"Unsupported file extension: {ext}")
+            return False
+
     def _load_busmaster(self, filepath):
         """Custom parser for BusMaster .log files."""
-        data_list = []
-        base_time_seconds = None
-        
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('***'):
-                    continue
-                
-                parts = line.split()
-                if len(parts) < 6:
-                    continue
-                
-                # Format: Time Tx/Rx Channel ID Type DLC Data...
-                # Ex: 17:48:32:9099 Rx 1 0x004 s 8 04 08 ...
-                
-                try:
-                    time_str = parts[0]
-                    # Parse Time HH:MM:SS:mmmm
-                    # Split by ':'
-                    t_parts = time_str.split(':')
-                    if len(t_parts) == 4:
-                        h = int(t_parts[0])
-                        m = int(t_parts[1])
-                        s = int(t_parts[2])
-                        ms = int(t_parts[3]) # This might be 0.1ms units (0-9999)
-                        
-                        # Convert to seconds
-                        # If ms has 4 digits, it is 0.1ms resolution.
-                        # If 3 digits, 1ms.
-                        # Usually Busmaster is 0.1ms (100us). 
-                        # 9099 -> 909.9ms
-                        
-                        seconds = h * 3600 + m * 60 + s + (ms / 10000.0)
-                        
-                        if base_time_seconds is None:
-                            base_time_seconds = seconds
-                        
-                        rel_time = seconds - base_time_seconds
-                        # Handle day rollover? (If log crosses midnight)
-                        if rel_time < 0:
-                            rel_time += 24 * 3600
-
-                        can_id_str = parts[3]
-                        can_id = int(can_id_str, 16)
-                        
-                        dlc = int(parts[5])
-                        
-                        data_hex_parts = parts[6:6+dlc]
-                        data_hex = "".join(data_hex_parts)
-                        
-                        data_list.append({
-                            'Timestamp': rel_time,
-                            'ID': can_id,
-                            'DLC': dlc,
-                            'Data': data_hex,
-                            'Channel': int(parts[2])
-                        })
-                except Exception as e:
-                    # Skip malformed lines
-                    continue
-
-        if not data_list:
+        # C-level regex scans over the memory-mapped file pick the frame
+        # lines: header lines ('***') and malformed lines simply do not match.
+        # Each block of matched lines is then split into fields with NumPy
+        blocks = []
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    blocks = [_parse_busmaster_lines(lines) for lines in _find_lines(mm, _BUSMASTER_RE)]
+
+        if not blocks:
             print("No CAN frames found in BusMaster log.")
             return False
 
-        self.df = pd.DataFrame(data_list)
-        self.decoded_cache = {}
+        seconds, channel, can_id, dlc, data_bytes = _concat_blocks(blocks)
+        rel_time = seconds - seconds[0]
+        # Handle day rollover (log crosses midnight)
+        rel_time[rel_time < 0] += 24 * 3600
+
+        self._set_frames(rel_time, can_id, dlc, channel, data_bytes)
         print(f"Loaded BusMaster Log: {len(self.df)} frames")
         return True
 
+    def _load_asc_fast(self, filepath):
+        """
+        Parses a Vector ASC log with regex scans over the memory-mapped file,
+        giving the same frames as python-can's ASCReader. Only hex-base logs of
+        classic data frames are handled; returns False for anything else
+        (decimal base, remote/error/CAN FD frames) so the caller falls back to
+        python-can.
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _ASC_BASE_DEC_RE.search(mm, 0, ASC_HEADER_BYTES):
+                    return False
+                blocks = [_parse_asc_lines(lines) for lines in _find_lines(mm, _ASC_FRAME_RE)]
+                # Any frame line the fast pattern does not cover: let python-can read it
+                frames = sum(len(block[0]) for block in blocks)
+                if not frames or frames != len(_ASC_ANY_FRAME_RE.findall(mm)):
+                    return False
+
+        ts, channel, can_id, dlc, data_bytes = _concat_blocks(blocks)
+        # Relative to the first frame, like _load_can_log
+        ts -= ts[0]
+        self._set_frames(ts, can_id, dlc, channel, data_bytes)
+        print(f"Loaded Log ({filepath}): {len(self.df)} frames")
+        return True
+
     def _load_csv(self, filepath):
-        # Try parsing as CSV first
-        self.df = pd.read_csv(filepath)
-        
-        # Normalize column names
-        self.df.columns = [c.strip().lower() for c in self.df.columns]
-        
-        # Ensure required columns exist, map common variations
-        col_map = {
-            'time': 'Timestamp', 'timestamp': 'Timestamp',
-            'id': 'ID', 'can_id': 'ID', 'identifier': 'ID',
-            'dlc': 'DLC', 'len': 'DLC', 'length': 'DLC',
-            'data': 'Data', 'payload': 'Data'
-        }
-        
-        self.df = self.df.rename(columns=col_map)
-        
-        # Clean up ID (handle 0x prefix)
-        if self.df['ID'].dtype == object:
-            self.df['ID'] = self.df['ID'].astype(str).apply(lambda x: int(x, 16) if 'x' in x else int(x))
-        
-        # Sort by timestamp
-        self.df = self.df.sort_values('Timestamp').reset_index(drop=True)
+        # Payload columns are always read as text, so hex such as '0102...'
+        # is not inferred as an integer and keeps its leading zeros
+        header = pd.read_csv(filepath, nrows=0).columns
+        dtypes = {c: CSV_READ_DTYPES[CSV_COLUMN_MAP[c.strip().lower()]] for c in header
+                  if CSV_COLUMN_MAP.get(c.strip().lower()) in CSV_READ_DTYPES}
+
+        if os.path.getsize(filepath) > CSV_CHUNK_BYTES:
+            # Big logs are read in chunks so each chunk's hex text can be
+            # dropped as soon as it is converted
+            chunks = pd.read_csv(filepath, engine='c', dtype=dtypes, chunksize=CSV_CHUNK_ROWS)
+        else:
+            chunks = [_read_csv(filepath, dtypes)]
+
+        frames = []
+        payloads = []
+        for chunk in chunks:
+            # Normalize column names, map common variations
+            chunk.columns = [c.strip().lower() for c in chunk.columns]
+            chunk = chunk.rename(columns=CSV_COLUMN_MAP)
+
+            # Clean up ID (handle 0x prefix)
+            chunk['ID'] = _parse_ids(chunk['ID']).astype(np.uint32)
+
+            # Parse the hex payloads once into the raw byte array
+            payloads.append(_hex_to_u8(chunk.pop('Data')))
+            frames.append(chunk)
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        data_bytes = _concat_payloads(payloads)
+
+        # Sort by timestamp; logs are usually in order already, then nothing is copied
+        if not df['Timestamp'].is_monotonic_increasing:
+            order = np.argsort(df['Timestamp'].to_numpy(), kind='stable')
+            df = df.take(order)
+            data_bytes = data_bytes[order]
+        df.reset_index(drop=True, inplace=True)
+        self.df = _with_frame_dtypes(df)
+        self.data_bytes = data_bytes
         
         # Clear cache on new log load
-        self.decoded_cache = {}
+        self._frames_loaded()
         
         print(f"Loaded Log: {len(self.df)} frames")
         return True
 
     def _load_can_log(self, filepath):
         """Uses python-can to read standard log formats (ASC, BLF, etc)."""
-        data_list = []
-        
-        # can.LogReader automatically detects format for many types
-        # For .asc, it works well. For .log, it depends on the content.
-        with can.LogReader(filepath) as reader:
+        reader_cls, mode = PREFETCH_READERS[os.path.splitext(filepath)[1].lower()]
+
+        # The file has its own with, so it is closed even if the reader rejects it
+        with _open_prefetched(filepath, mode) as f, reader_cls(f) as reader:
+            # Plain list appends per message; everything is converted to
+            # arrays once at the end, payloads from one flat bytearray
+            ts, ids, dlc, channel, lengths = [], [], [], [], []
+            payload = bytearray()
             for msg in reader:
-                # Convert data bytes to hex string
-                data_hex = msg.data.hex()
-                
-                data_list.append({
-                    'Timestamp': msg.timestamp,
-                    'ID': msg.arbitration_id,
-                    'DLC': msg.dlc,
-                    'Data': data_hex,
-                    'Channel': msg.channel
-                })
+                ts.append(msg.timestamp)
+                ids.append(msg.arbitration_id)
+                dlc.append(msg.dlc)
+                channel.append(msg.channel)
+                lengths.append(len(msg.data))
+                payload += msg.data
         
-        if not data_list:
+        if not ts:
             print("No CAN frames found in log.")
             return False
-            
-        self.df = pd.DataFrame(data_list)
-        
-        # Adjust timestamps to start at 0 if desired? 
-        # Usually ASC has absolute or relative timestamps. 
-        # For now, we keep as is, but maybe useful to normalize to start from 0 if huge.
-        if not self.df.empty:
-             first_ts = self.df['Timestamp'].iloc[0]
-             # Optional: normalize to 0
-             self.df['Timestamp'] = self.df['Timestamp'] - first_ts
-
-        self.decoded_cache = {}
+
+        # Usually ASC has absolute or relative timestamps.
+        # Normalize to start from 0, absolute times are huge.
+        ts = np.array(ts, dtype=np.float64)
+        ts -= ts[0]
+
+        # Each row takes its payload's bytes from the front, CAN FD widens the array
+        lengths = np.array(lengths)
+        width = max(DATA_WIDTH, int(lengths.max()))
+        data = np.zeros((len(lengths), width), dtype=np.uint8)
+        data[np.arange(width) < lengths[:, None]] = np.frombuffer(payload, dtype=np.uint8)
+
+        self._set_frames(ts, np.array(ids, dtype=np.uint32), np.array(dlc, dtype=np.uint8), channel, data)
         print(f"Loaded Log ({filepath}): {len(self.df)} frames")
         return True
 
+    def _set_frames(self, timestamps, ids, dlc, channel, data_bytes):
+        """Replaces the loaded frames with these columns and the (N, width) payload array."""
+        # Columns come in their final dtypes, so the frame wraps them without copies
+        self.df = _with_frame_dtypes(pd.DataFrame({
+            'Timestamp': timestamps,
+            'ID': ids,
+            'DLC': dlc,
+            'Channel': pd.Categorical(channel)
+        }, copy=False))
+        self.data_bytes = data_bytes
+        self._frames_loaded()
+
+    def _frames_loaded(self):
+        """Rebuilds per-log state after self.df / self.data_bytes are replaced."""
+        # Group row positions by ID once: a stable argsort keeps each group sorted
+        ids = self.df['ID'].to_numpy()
+        order = np.argsort(ids, kind='stable')
+        uniq, starts = np.unique(ids[order], return_index=True)
+        ends = np.append(starts[1:], len(ids))
+        self._id_index = {int(u): order[s:e] for u, s, e in zip(uniq, starts, ends)}
+        # Small dense integer per ID, so per-ID state can live in plain arrays
+        self.id_codes, self.id_uniques = pd.factorize(ids)
+
+        self._clear_decode_caches()
+
+    def _clear_decode_caches(self):
+        self._decoded_dict_cache.clear()
+        self._decoded_str_cache.clear()
+        self._trace_cache.clear()
+
     def decode_message(self, can_id, data_bytes):
         """Decodes a single message based on ID and raw bytes."""
         if not self.db:
             return "No DBC Loaded"
         
-        try:
-            message = self.db.get_message_by_frame_id(can_id)
-            decoded = message.decode(data_bytes)
-            return decoded # Returns a dictionary of signal_name: value
-        except KeyError:
+        message = self._msg_by_id.get(can_id)
+        if message is None:
             return "Unknown ID"
-        except Exception:
+        if len(data_bytes) < message.length:
+            return "Short Data"
+
+        decoded = _decode_or_none(message, data_bytes)
+        if decoded is None:
             return "Decode Error"
+        return decoded # Returns a dictionary of signal_name: value
+
+    def _decode_raw(self, can_id, data_bytes):
+        """Decodes to {signal_name: value}, None for unknown IDs or undecodable data."""
+        message = self._msg_by_id.get(can_id)
+        if message is None:
+            return None
+        return _decode_or_none(message, data_bytes)
+
+    def decode_payload(self, message, payload):
+        """Decodes a payload with a DBC message from get_message, None if it does not decode."""
+        return _decode_or_none(message, payload)
 
     def generate_mock_data(self, count=1000):
         """Generates mock CAN traffic for testing."""
-        timestamps = np.cumsum(np.random.uniform(0.001, 0.05, count))
-        ids = [0x100, 0x101, 0x200]
-        data_list = []
+        rng = np.random.default_rng()
         
-        for t in timestamps:
-            cid = random.choice(ids)
-            # Generate random 8 bytes
-            data_int = random.getrandbits(64)
-            data_hex = f"{data_int:016x}"
-            data_list.append({
-                'Timestamp': t,
-                'ID': cid,
-                'DLC': 8,
-                'Data': data_hex,
-                'Channel': 1
-            })
-            
-        self.df = pd.DataFrame(data_list)
+        self._set_frames(np.cumsum(rng.uniform(0.001, 0.05, count)),
+                         rng.choice(np.array([0x100, 0x101, 0x200], dtype=np.uint32), count),
+                         np.full(count, 8, dtype=np.uint8),
+                         np.ones(count, dtype=np.int64),
+                         # Random 8 byte payloads
+                         rng.integers(0, 256, (count, DATA_WIDTH), dtype=np.uint8))
         print("Generated mock data.")
 
     def get_frame_by_index(self, index):
@@ -228,67 +750,122 @@ class CANLoader:
             return self.df.iloc[index]
         return None
 
+    def get_payload(self, index, dlc):
+        """Returns the raw payload bytes of the frame at 'index'."""
+        return self.data_bytes[index, :int(dlc)].tobytes()
+
+    def decode_frame(self, index):
+        """
+        Decodes the frame at 'index' to {signal_name: value}, None if it does not
+        decode. Results go through the per-frame dict cache.
+        """
+        decoded = self._decoded_dict_cache.get(index, _MISSING)
+        if decoded is _MISSING:
+            row = self.df.iloc[index]
+            decoded = self._decode_raw(int(row['ID']), self.get_payload(index, row['DLC']))
+            self._decoded_dict_cache[index] = decoded
+        return decoded
+
     def get_decoded_string(self, index):
         """Returns a string representation of decoded signals for the UI."""
-        if index in self.decoded_cache:
-            return self.decoded_cache[index]
+        res = self._decoded_str_cache.get(index)
+        if res is not None:
+            return res
 
-        row = self.df.iloc[index]
-        can_id = row['ID']
-        data_str = str(row['Data']).strip()
-        
-        # Convert hex string to bytes
-        try:
-            # Pad if odd length or short
-            if len(data_str) % 2 != 0:
-                data_str = "0" + data_str
-            data_bytes = bytes.fromhex(data_str)
-        except:
-            return "Invalid Data"
-
-        decoded = self.decode_message(can_id, data_bytes)
+        decoded = self.decode_frame(index)
         
-        if isinstance(decoded, dict):
+        if decoded is not None:
             # Format as "Sig1: 12.5, Sig2: 100"
             res = ", ".join([f"{k}: {v}" for k, v in decoded.items()])
         else:
-            res = str(decoded)
+            # Not decodable: let decode_message tell why
+            row = self.df.iloc[index]
+            res = str(self.decode_message(int(row['ID']), self.get_payload(index, row['DLC'])))
             
-        self.decoded_cache[index] = res
+        self._decoded_str_cache[index] = res
         return res
 
+    def last_frame_positions(self, end):
+        """Row positions of the latest frame of each ID within rows 0..end, in row order."""
+        positions = []
+        for rows in self._id_index.values():
+            k = np.searchsorted(rows, end, side='right')
+            if k:
+                positions.append(rows[k - 1])
+        return np.sort(np.array(positions, dtype=np.intp))
+
+    def get_message(self, can_id):
+        """Returns the DBC message definition for a CAN ID, or None if unknown."""
+        return self._msg_by_id.get(can_id)
+
     def get_signals_for_id(self, can_id):
         """Returns a list of signal names for a given CAN ID."""
-        if not self.db:
-            return []
-        try:
-            msg = self.db.get_message_by_frame_id(can_id)
-            return [s.name for s in msg.signals]
-        except:
+        msg = self._msg_by_id.get(can_id)
+        if msg is None:
             return []
+        return [s.name for s in msg.signals]
+
+    def _get_signal_extractor(self, message, signal_name):
+        """Returns the cached vectorized extractor for a signal (None if unsupported)."""
+        key = (message.frame_id, signal_name)
+        if key not in self._extractors:
+            signal = next((s for s in message.signals if s.name == signal_name), None)
+            # cantools drops frames of a multiplexed message whose mux value is not
+            # in the DBC, for every signal; only the decode path knows those values
+            if signal is None or message.is_multiplexed():
+                self._extractors[key] = None
+            else:
+                self._extractors[key] = _compile_signal_extractor(signal)
+        return self._extractors[key]
 
     def get_signal_trace(self, can_id, signal_name):
+        """
+        Returns (timestamps, float32 values) of a signal over the whole log.
+        Each trace is computed once per log/DBC and then served from a cache.
+        """
+        key = (can_id, signal_name)
+        trace = self._trace_cache.get(key)
+        if trace is None:
+            times, values = self._build_signal_trace(can_id, signal_name)
+            trace = (times, np.ascontiguousarray(values, dtype=np.float32))
+            self._trace_cache[key] = trace
+        return trace
+
+    def _build_signal_trace(self, can_id, signal_name):
         """
         Extracts timestamps and values for a specific signal.
-        This iterates over the dataframe, which can be slow for large logs.
+        Rows of the ID come from the per-ID index. Plain integer signals of
+        non-multiplexed messages are then extracted from the payload array in
+        one pass; others are decoded frame by frame with the message definition.
         """
-        if self.df.empty:
-            return [], []
+        message = self._msg_by_id.get(can_id)
+        if self.df.empty or message is None:
+            return np.array([], dtype=np.float64), []
 
-        # Filter DF for this ID
-        subset = self.df[self.df['ID'] == can_id]
-        
-        timestamps = []
-        values = []
-        
-        for _, row in subset.iterrows():
-            try:
-                data_bytes = bytes.fromhex(row['Data'])
-                decoded = self.decode_message(can_id, data_bytes)
-                if isinstance(decoded, dict) and signal_name in decoded:
-                    timestamps.append(row['Timestamp'])
-                    values.append(decoded[signal_name])
-            except:
-                continue
-                
-        return timestamps, values
+        rows = self._id_index.get(can_id, np.array([], dtype=np.intp))
+
+        extract = self._get_signal_extractor(message, signal_name)
+        if extract is not None:
+            # cantools refuses frames shorter than the message, skip them too
+            rows = rows[self.df['DLC'].to_numpy()[rows] >= message.length]
+            return self.df['Timestamp'].to_numpy()[rows], extract(self.data_bytes[rows])
+
+        ts_arr = self.df['Timestamp'].to_numpy()[rows]
+        dlc_arr = self.df['DLC'].to_numpy()[rows]
+        data_arr = self.data_bytes[rows]
+
+        # Frames already decoded for the list view come from the dict cache
+        cache = self._decoded_dict_cache
+        decoded = []
+        for i, d, n in zip(rows, data_arr, dlc_arr):
+            cached = cache.get(i, _MISSING)
+            if cached is _MISSING:
+                cached = _decode_or_none(message, d[:n].tobytes())
+            decoded.append(cached)
+        keep = np.fromiter((d is not None and signal_name in d for d in decoded),
+                           dtype=bool, count=len(decoded))
+        # Choice values plot as their raw number
+        values = [getattr(d[signal_name], 'value', d[signal_name])
+                  for d in decoded if d is not None and signal_name in d]
+
+        return ts_arr[keep], values
@@ -0,0 +1,80 @@
+import numpy as np
+
+# Frames are replayed in blocks of this many rows, so the per-frame
+# temporaries stay small whatever the log size and payload width
+REPLAY_BLOCK_FRAMES = 1 << 16
+
+def replay_byte_states(data_bytes, dlcs, id_codes, up_to, num_ids):
+    """
+    Replays the trace change highlighting over frames 0..up_to in one pass.
+    Returns (last_bytes, last_dlc, states, seen), one row per ID code:
+    the latest payload and DLC of each ID, its byte states (0=Gray, 1=Red,
+    2=Yellow) as stepping frame by frame would leave them, and whether the
+    ID occurred at all.
+
+    Per ID the states only depend on its own frames: since the last reset
+    (first sight or DLC change) a byte is Red if the latest frame changed
+    it, Yellow if an earlier frame did, Gray otherwise.
+    """
+    width = data_bytes.shape[1]
+    last_bytes = np.zeros((num_ids, width), dtype=np.uint8)
+    last_dlc = np.zeros(num_ids, dtype=np.uint8)
+    states = np.zeros((num_ids, width), dtype=np.uint8)
+    seen = np.zeros(num_ids, dtype=bool)
+
+    for start in range(0, up_to + 1, REPLAY_BLOCK_FRAMES):
+        stop = min(start + REPLAY_BLOCK_FRAMES, up_to + 1)
+        _replay_block(data_bytes[start:stop], dlcs[start:stop], id_codes[start:stop],
+                      num_ids, last_bytes, last_dlc, states, seen)
+    return last_bytes, last_dlc, states, seen
+
+def _replay_block(data_bytes, dlcs, id_codes, num_ids, last_bytes, last_dlc, states, seen):
+    """Advances the per-ID replay arrays in place over one block of frames."""
+    width = data_bytes.shape[1]
+
+    # Group the frames by ID, keeping time order inside each group
+    codes = id_codes
+    if num_ids <= np.iinfo(np.uint16).max:
+        codes = codes.astype(np.uint16) # Small keys sort with a radix sort
+    order = np.argsort(codes, kind='stable')
+    c = codes[order]
+    d = dlcs[order]
+    payload = data_bytes[order]
+
+    # Previous frame of the same ID: the row before, or for the first row of
+    # an ID the last frame of earlier blocks
+    first = np.ones(len(c), dtype=bool)
+    first[1:] = c[1:] != c[:-1]
+    c_first = c[first]
+    prev = np.empty_like(payload)
+    prev[1:] = payload[:-1]
+    prev[first] = last_bytes[c_first]
+    prev_d = np.empty_like(d)
+    prev_d[1:] = d[:-1]
+    prev_d[first] = last_dlc[c_first]
+
+    # Frame j continues the previous frame of its ID; a new ID or DLC resets the states
+    same = ~first
+    same[first] = seen[c_first]
+    reset = ~same | (d != prev_d)
+
+    # Bytes changed against the previous frame of the ID (only bytes both frames have)
+    changed = payload != prev
+    changed &= same[:, None]
+    changed &= np.arange(width) < np.minimum(d, prev_d)[:, None]
+
+    # Any change per reset segment (segments never span two IDs); a segment
+    # continuing from earlier blocks also keeps the changes recorded there
+    seg_start = reset | first
+    seg_changed = np.logical_or.reduceat(changed, np.flatnonzero(seg_start), axis=0)
+    seg_of = np.cumsum(seg_start) - 1
+    carried = np.flatnonzero(first & ~reset)
+    seg_changed[seg_of[carried]] |= states[c[carried]] != 0
+
+    # Pick the segment of each ID's last frame
+    last = np.append(np.flatnonzero(c[1:] != c[:-1]), len(c) - 1)
+    ids = c[last]
+    last_bytes[ids] = payload[last]
+    last_dlc[ids] = d[last]
+    states[ids] = np.where(changed[last], 1, np.where(seg_changed[seg_of[last]], 2, 0))
+    seen[ids] = True
@@ -0,0 +1,268 @@
+import functools
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QSize
+from PyQt6.QtGui import QColor, QFont, QFontDatabase, QFontMetrics
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+
+COLUMNS = ["Time", "Ch", "ID", "Name", "DLC", "Data / Decoded"]
+DATA_COLUMN = 5
+# Default width of the fixed trace columns
+COLUMN_WIDTH = 90
+# Vertical padding added to the monospace font height for the row height
+ROW_PADDING = 4
+
+# Highlight colors by change state: 0=Gray (unchanged), 1=Red (changed), 2=Yellow (changed before)
+STATE_COLORS = ["#E0E0E0", "#FF3333", "#FFFF33"]
+
+# Two-digit hex text for every byte value
+HEX_BYTES = [f"{b:02X}" for b in range(256)]
+# Text for every DLC / payload length up to CAN FD's 64 bytes
+DLC_TEXT = [str(i) for i in range(65)]
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(ts):
+    """Formats a timestamp for the Time column; repaints of unchanged rows hit the cache."""
+    return f"{ts:.4f}"
+
+def signal_text(node):
+    """Display text of a signal row: value plus unit, empty until decoded."""
+    msg = node.parent
+    value = msg.signal_values[node.row]
+    return "" if value is None else f"{value}{msg.signal_units[node.row]}"
+
+class MessageNode:
+    """
+    Top level row: the latest frame of one CAN ID. Decoded signal values and
+    states are kept here for every signal; the signal rows themselves are
+    only created once the row is expanded, and values are only formatted
+    when painted.
+    """
+    __slots__ = ('row', 'can_id', 'channel', 'name', 'id_text', 'channel_text',
+                 'timestamp', 'dlc', 'data', 'byte_states',
+                 'signal_names', 'signal_units', 'signal_values', 'signal_states', 'children')
+
+    def __init__(self, row, can_id, channel, name, signal_names, signal_units):
+        self.row = row
+        self.can_id = can_id
+        self.channel = channel
+        self.name = name
+        # Fixed per row, formatted once
+        self.id_text = f"0x{can_id:X}"
+        self.channel_text = str(channel)
+        self.timestamp = 0.0
+        self.dlc = 0
+        self.data = b''
+        self.byte_states = []
+        self.signal_names = signal_names
+        self.signal_units = signal_units # " unit" or "" per signal
+        self.signal_values = [None] * len(signal_names)
+        self.signal_states = [0] * len(signal_names)
+        self.children = [] # SignalNodes, created by TraceModel.fetchMore
+
+class SignalNode:
+    """Child row: one decoded signal of a message (values live on the parent)."""
+    __slots__ = ('row', 'parent', 'name')
+
+    def __init__(self, row, parent, name):
+        self.row = row
+        self.parent = parent
+        self.name = name
+
+class TraceModel(QAbstractItemModel):
+    """
+    Tree model of the trace window. Rows live in plain Python objects; the
+    view only asks for the rows it paints, and the data column hands the
+    byte/state segments to ByteHighlightDelegate via Qt.ItemDataRole.UserRole.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self._batch = False
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.endResetModel()
+
+    def begin_batch(self):
+        """
+        Starts rebuilding the model from scratch: rows added until end_batch
+        emit no per-row signals, the view is reset once at the end.
+        """
+        self.beginResetModel()
+        self.rows = []
+        self._batch = True
+
+    def end_batch(self):
+        self._batch = False
+        self.endResetModel()
+
+    def add_message(self, can_id, channel, name, signal_names, signal_units):
+        """Appends a message row and returns its node; signal rows come on expand."""
+        row = len(self.rows)
+        node = MessageNode(row, can_id, channel, name, signal_names, signal_units)
+
+        if self._batch:
+            self.rows.append(node)
+            return node
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(node)
+        self.endInsertRows()
+        return node
+
+    def message_changed(self, node):
+        if self._batch:
+            return
+        self.dataChanged.emit(self.createIndex(node.row, 0, node),
+                              self.createIndex(node.row, DATA_COLUMN, node))
+
+    def signals_changed(self, node):
+        """Repaints the signal rows of a message (nothing to do until they exist)."""
+        if self._batch or not node.children:
+            return
+        self.dataChanged.emit(self.createIndex(0, DATA_COLUMN, node.children[0]),
+                              self.createIndex(len(node.children) - 1, DATA_COLUMN, node.children[-1]))
+
+    def message_index(self, node):
+        return self.createIndex(node.row, 0, node)
+
+    # QAbstractItemModel interface
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self.rows[row])
+        return self.createIndex(row, column, parent.internalPointer().children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if isinstance(node, SignalNode):
+            return self.createIndex(node.parent.row, 0, node.parent)
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.rows)
+        node = parent.internalPointer()
+        if isinstance(node, MessageNode) and parent.column() == 0:
+            return len(node.children)
+        return 0
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.rows)
+        node = parent.internalPointer()
+        return isinstance(node, MessageNode) and parent.column() == 0 and bool(node.signal_names)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        node = parent.internalPointer()
+        return isinstance(node, MessageNode) and bool(node.signal_names) and not node.children
+
+    def fetchMore(self, parent):
+        """Creates the signal rows of a message, called by the view on expand."""
+        node = parent.internalPointer()
+        self.beginInsertRows(parent, 0, len(node.signal_names) - 1)
+        node.children = [SignalNode(i, node, s) for i, s in enumerate(node.signal_names)]
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if isinstance(node, SignalNode):
+                if col == 3:
+                    return node.name
+                if col == DATA_COLUMN:
+                    return signal_text(node)
+                return ""
+            if col == 0:
+                return format_timestamp(node.timestamp)
+            if col == 1:
+                return node.channel_text
+            if col == 2:
+                return node.id_text
+            if col == 3:
+                return node.name
+            if col == 4:
+                return DLC_TEXT[node.dlc]
+            if col == DATA_COLUMN:
+                return " ".join([HEX_BYTES[b] for b in node.data])
+            return None
+
+        if role == Qt.ItemDataRole.UserRole and col == DATA_COLUMN:
+            # [(text, state), ...] segments painted by ByteHighlightDelegate
+            if isinstance(node, SignalNode):
+                return [(signal_text(node), node.parent.signal_states[node.row])]
+            return [(HEX_BYTES[b], s) for b, s in zip(node.data, node.byte_states)]
+        return None
+
+class ByteHighlightDelegate(QStyledItemDelegate):
+    """
+    Paints the data column as monospace segments colored by change state.
+    Every row reports the same height, so with setUniformRowHeights the view
+    never has to measure rows one by one.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._colors = [QColor(c) for c in STATE_COLORS]
+        self._base_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        self._fonts = {} # {point size: (QFont, QFontMetrics, row height)}
+
+    def _font(self, point_size):
+        """Returns the cached monospace font, its metrics and row height for a point size."""
+        entry = self._fonts.get(point_size)
+        if entry is None:
+            font = QFont(self._base_font)
+            if point_size > 0:
+                font.setPointSizeF(point_size)
+            fm = QFontMetrics(font)
+            entry = (font, fm, fm.height() + ROW_PADDING)
+            self._fonts[point_size] = entry
+        return entry
+
+    def sizeHint(self, option, index):
+        # Constant: independent of the row's content
+        return QSize(option.rect.width(), self._font(option.font.pointSizeF())[2])
+
+    def paint(self, painter, option, index):
+        segments = index.data(Qt.ItemDataRole.UserRole)
+        if not segments:
+            super().paint(painter, option, index)
+            return
+
+        # Background / selection from the style, text drawn below
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+
+        font, fm, _ = self._font(option.font.pointSizeF())
+        space = fm.horizontalAdvance(" ")
+        painter.save()
+        painter.setFont(font)
+        rect = option.rect.adjusted(3, 0, 0, 0)
+        flags = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        x = rect.left()
+        for text, state in segments:
+            painter.setPen(self._colors[state])
+            painter.drawText(x, rect.top(), rect.right() - x, rect.height(), flags, text)
+            x += fm.horizontalAdvance(text) + space
+        painter.restore()
@@ -1,13 +1,24 @@
 import sys
 import os
+import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QFileDialog, QTreeWidget, 
-                             QTreeWidgetItem, QLabel, QSlider, QSplitter, QHeaderView,
+                             QHBoxLayout, QPushButton, QFileDialog, QTreeView, 
+                             QLabel, QSlider, QSplitter, QHeaderView,
                              QComboBox)
-from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtCore import Qt, QTimer
+import numpy as np
 import pyqtgraph as pg
-from can_loader import CANLoader
+from can_loader import CANLoader, DATA_WIDTH
+from trace_model import TraceModel, ByteHighlightDelegate, SignalNode, DATA_COLUMN, COLUMN_WIDTH
+from replay import replay_byte_states
+
+# Forward seeks up to this many frames replay the frames instead of rebuilding the trace
+SEEK_REPLAY_LIMIT = 500
+# While dragging, slider moves are coalesced and applied at most this often
+SEEK_DEBOUNCE_MS = 15
+# Next byte state, indexed by [changed, current state]:
+# changed -> Red (1); unchanged -> Red becomes Yellow (2), Gray/Yellow stay
+STATE_NEXT = np.array([[0, 2, 2], [1, 1, 1]], dtype=np.uint8)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -22,12 +33,17 @@ class MainWindow(QMainWindow):
         self.playback_speed = 1.0
         
         # Trace Window State
-        self.message_items = {} # {can_id: QTreeWidgetItem}
-        self.signal_items = {}  # {(can_id, signal_name): QTreeWidgetItem}
-        self.last_data = {}     # {can_id: hex_string}
-        self.last_signals = {}  # {(can_id, signal_name): value}
-        self.byte_states = {}   # {can_id: [state_byte_0, state_byte_1, ...]} 0=Gray, 1=Red, 2=Yellow
-        self.signal_states = {} # {(can_id, signal_name): state} 0=Gray, 1=Red, 2=Yellow
+        self.message_items = {} # {can_id: MessageNode}
+        self.prev_bytes = np.zeros((0, DATA_WIDTH), dtype=np.uint8) # Last payload per ID code
+        self.prev_dlc = np.zeros(0, dtype=np.uint8) # Last DLC per ID code, 0 = not seen yet
+        self.byte_states = np.zeros((0, DATA_WIDTH), dtype=np.uint8) # Per ID code and byte: 0=Gray, 1=Red, 2=Yellow
+        # Signals are numbered per log/DBC: _sig_offset[id_code] + position in the message
+        self.last_signals = np.zeros(0) # Last numeric value per signal, NaN = not seen yet
+        self.signal_states = np.zeros(0, dtype=np.uint8) # Per signal: 0=Gray, 1=Red, 2=Yellow
+        self.last_wide = {} # {flat signal number: last int} for integer signals wider than float64's 53 bits
+        self._msg_cache = {}    # {can_id: message info dict or None}, see _msg_info
+        self._cache_columns()
+        self._build_signal_layout()
 
         # Main Layout
         main_widget = QWidget()
@@ -69,7 +85,9 @@ class MainWindow(QMainWindow):
         self.slider = QSlider(Qt.Orientation.Horizontal)
         self.slider.sliderPressed.connect(self.slider_pressed)
         self.slider.sliderReleased.connect(self.slider_released)
-        self.slider.valueChanged.connect(self.slider_moved)
+        # Queued: a burst of value changes is handled after the event that caused it,
+        # and slider_moved skips all but the latest one
+        self.slider.valueChanged.connect(self.slider_moved, Qt.ConnectionType.QueuedConnection)
         controls_layout.addWidget(self.slider)
 
         layout.addLayout(controls_layout)
@@ -94,19 +112,35 @@ class MainWindow(QMainWindow):
         self.plot_widget.setBackground('w')
         self.plot_widget.showGrid(x=True, y=True)
         self.plot_widget.setTitle("Signal Trace")
+        # Long traces: decimate to the visible pixels and skip offscreen points
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setAntialiasing(False)
+        # Current time cursor, created once and moved with setPos
+        self.cursor_line = pg.InfiniteLine(angle=90, pen=pg.mkPen('r'))
+        self.plot_widget.addItem(self.cursor_line, ignoreBounds=True)
+        # Signal curve and message occurrence dots, refilled with setData
+        self.trace_curve = self.plot_widget.plot([], [], pen='b')
+        self.scatter_curve = pg.ScatterPlotItem(size=5)
+        self.plot_widget.addItem(self.scatter_curve)
         graph_layout.addWidget(self.plot_widget)
         
         splitter.addWidget(graph_widget)
 
-        # Trace Tree
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(6)
-        self.tree.setHeaderLabels(["Time", "Ch", "ID", "Name", "DLC", "Data / Decoded"])
-        self.tree.header().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
-        self.tree.itemClicked.connect(self.on_tree_click)
+        # Trace Tree (model/view: only visible rows are painted)
+        self.model = TraceModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setItemDelegateForColumn(DATA_COLUMN, ByteHighlightDelegate(self.tree))
+        self.tree.header().setSectionResizeMode(DATA_COLUMN, QHeaderView.ResizeMode.Stretch)
+        self.tree.clicked.connect(self.on_tree_click)
+        # Fixed geometry: one row height for all rows (see ByteHighlightDelegate.sizeHint),
+        # no word wrap, fixed default column widths
         self.tree.setUniformRowHeights(True)
+        self.tree.setWordWrap(False)
+        self.tree.header().setDefaultSectionSize(COLUMN_WIDTH)
         # Dark Theme for Tree
-        self.tree.setStyleSheet("QTreeWidget { background-color: black; color: #E0E0E0; } QHeaderView::section { background-color: #333; color: white; }")
+        self.tree.setStyleSheet("QTreeView { background-color: black; color: #E0E0E0; } QHeaderView::section { background-color: #333; color: white; }")
         splitter.addWidget(self.tree)
         
         # Set initial splitter sizes (Graph smaller, Table larger)
@@ -117,6 +151,13 @@ class MainWindow(QMainWindow):
         self.timer.timeout.connect(self.update_playback)
         self.timer_interval = 50 # ms
 
+        # Timer coalescing slider drags into one seek per SEEK_DEBOUNCE_MS
+        self.seek_timer = QTimer()
+        self.seek_timer.setSingleShot(True)
+        self.seek_timer.setInterval(SEEK_DEBOUNCE_MS)
+        self.seek_timer.timeout.connect(self._apply_seek)
+        self._pending_seek = 0
+
     def load_log_dialog(self):
         fname, _ = QFileDialog.getOpenFileName(self, "Open Log File", "", "Supported Files (*.csv *.asc *.log *.blf);;CSV Files (*.csv);;Vector ASC (*.asc);;Log Files (*.log);;BLF Files (*.blf);;All Files (*)")
         if fname:
@@ -127,29 +168,64 @@ class MainWindow(QMainWindow):
         fname, _ = QFileDialog.getOpenFileName(self, "Open DBC File", "", "DBC Files (*.dbc);;All Files (*)")
         if fname:
             if self.loader.load_dbc(fname):
+                self._msg_cache = {}
                 self.refresh_table() # Refresh to show decoded names
 
     def generate_mock(self):
         self.loader.generate_mock_data()
         self.refresh_table()
 
+    def reset_trace_state(self):
+        """Empties the trace view and forgets all per-ID change tracking."""
+        self.model.clear()
+        self._reset_trace_arrays()
+
+    def _reset_trace_arrays(self):
+        """Forgets all per-ID change tracking, leaving the model alone."""
+        self.message_items = {}
+        self.last_signals = np.full(self._num_signals, np.nan)
+        self.signal_states = np.zeros(self._num_signals, dtype=np.uint8)
+        self.last_wide = {}
+        num_ids = len(self.loader.id_uniques)
+        self.prev_bytes = np.zeros((num_ids, self.loader.data_bytes.shape[1]), dtype=np.uint8)
+        self.prev_dlc = np.zeros(num_ids, dtype=np.uint8)
+        self.byte_states = np.zeros_like(self.prev_bytes)
+
+    def _cache_columns(self):
+        """Keeps plain ndarrays of the frame columns for per-frame access (df.iloc is slow)."""
+        df = self.loader.df
+        self._ts_arr = df['Timestamp'].to_numpy()
+        self._id_arr = df['ID'].to_numpy()
+        self._dlc_arr = df['DLC'].to_numpy()
+        self._ch_arr = df['Channel'].to_numpy() if 'Channel' in df else np.ones(len(df), dtype=np.uint8)
+        self._data_arr = self.loader.data_bytes
+
+    def _build_signal_layout(self):
+        """Numbers the DBC signals of every ID in the log, so signal state can live in flat arrays."""
+        counts = np.zeros(len(self.loader.id_uniques), dtype=np.intp)
+        for code, can_id in enumerate(self.loader.id_uniques):
+            info = self._msg_info(int(can_id))
+            if info:
+                counts[code] = len(info['signal_names'])
+        self._sig_offset = np.cumsum(counts) - counts
+        self._num_signals = int(counts.sum())
+
     def refresh_table(self):
         """
         Resets the trace view and processes frames up to current_index.
         For a fresh log load, current_index is 0.
         """
-        self.tree.clear()
-        self.message_items = {}
-        self.signal_items = {}
-        self.last_data = {}
-        self.last_signals = {}
-        self.byte_states = {}
-        self.signal_states = {}
+        self._cache_columns()
+        self._build_signal_layout()
+        self.reset_trace_state()
         
         if self.loader.df.empty:
             return
 
+        # Shrinking the range clamps the value; that is not a user seek
+        self.slider.blockSignals(True)
         self.slider.setRange(0, len(self.loader.df) - 1)
+        self.slider.blockSignals(False)
         
         # If just loaded, start at 0
         if self.current_index >= len(self.loader.df):
@@ -170,77 +246,67 @@ class MainWindow(QMainWindow):
     def step_back(self):
         if self.loader.df.empty: return
         if self.current_index > 0:
-            # decrementing slider triggers slider_moved -> rebuilds view
-            self.slider.setValue(self.current_index - 1)
+            # Going back rebuilds the view (seek to the previous frame)
+            self.seek_timer.stop()
+            self._pending_seek = self.current_index - 1
+            self._apply_seek()
+
+    def _msg_info(self, can_id):
+        """
+        Returns the cached DBC info for a CAN ID (None if unknown or no DBC):
+        {'def', 'name', 'signal_names', 'units', 'signal_index', 'wide'}; units are
+        ' unit' or '' per signal, signal_index maps a name to its position and
+        wide holds the positions of integer signals longer than 53 bits.
+        """
+        if can_id in self._msg_cache:
+            return self._msg_cache[can_id]
+        msg_def = self.loader.get_message(can_id)
+        info = None
+        if msg_def is not None:
+            info = {
+                'def': msg_def,
+                'name': msg_def.name,
+                'signal_names': [s.name for s in msg_def.signals],
+                'units': [(" " + s.unit) if s.unit else "" for s in msg_def.signals],
+                'signal_index': {s.name: k for k, s in enumerate(msg_def.signals)},
+                'wide': {k for k, s in enumerate(msg_def.signals) if not s.is_float and s.length > 53},
+            }
+        self._msg_cache[can_id] = info
+        return info
 
     def process_frame(self, index):
         """
-        Updates the Tree Widget with data from the frame at 'index'.
+        Updates the trace model with data from the frame at 'index'.
         Highlights changes compared to previous state.
         """
-        row = self.loader.df.iloc[index]
-        can_id = row['ID']
-        timestamp = row['Timestamp']
-        dlc = row['DLC']
-        data_str = str(row['Data']) # Hex string
-        
-        # Pad data if needed
-        if len(data_str) % 2 != 0:
-            data_str = "0" + data_str
-            
-        # Split into byte strings
-        current_bytes = [data_str[i:i+2] for i in range(0, len(data_str), 2)]
+        can_id = int(self._id_arr[index])
+        timestamp = self._ts_arr[index]
+        dlc = int(self._dlc_arr[index])
+        id_code = self.loader.id_codes[index]
+        current = self._data_arr[index] # Full-width row; bytes past DLC are ignored
         
         # Initialize States if New
-        if can_id not in self.byte_states:
+        # Reset state if DLC changed (rare but possible)
+        states = self.byte_states[id_code] # View into the state table
+        if self.prev_dlc[id_code] != dlc:
              # Default state 0 (Gray)
-             self.byte_states[can_id] = [0] * len(current_bytes)
-        
-        # Resize state if DLC changed (rare but possible)
-        if len(self.byte_states[can_id]) != len(current_bytes):
-            self.byte_states[can_id] = [0] * len(current_bytes)
+             states[:] = 0
 
-        # 1. Update or Create Message Row
+        # 1. Create Message Row on first sight (signal rows are created on expand)
+        info = self._msg_info(can_id)
         if can_id not in self.message_items:
-            # Create new
-            id_str = f"0x{can_id:X}"
             name = "Unknown"
-            msg_def = None
-            if self.loader.db:
-                try:
-                    msg_def = self.loader.db.get_message_by_frame_id(can_id)
-                    name = msg_def.name
-                except:
-                    pass
-            
-            # Initial create
-            item = QTreeWidgetItem([f"{timestamp:.4f}", str(row.get('Channel', 1)), id_str, name, str(dlc), ""])
-            
-            # Create Label for HTML Data
-            lbl = QLabel()
-            lbl.setStyleSheet("background-color: transparent;")
+            signal_names = []
+            units = []
+            if info:
+                name = info['name']
+                signal_names = info['signal_names']
+                units = info['units']
             
-            self.tree.addTopLevelItem(item)
-            self.tree.setItemWidget(item, 5, lbl)
-            self.message_items[can_id] = item
-            
-            # Create child items for signals if DBC exists
-            if msg_def:
-                for sig in msg_def.signals:
-                    sig_item = QTreeWidgetItem(["", "", "", sig.name, "", ""])
-                    item.addChild(sig_item)
-                    self.signal_items[(can_id, sig.name)] = sig_item
-                    
-                    # Also use Label for signal value
-                    s_lbl = QLabel()
-                    s_lbl.setStyleSheet("background-color: transparent;")
-                    self.tree.setItemWidget(sig_item, 5, s_lbl)
-
-        item = self.message_items[can_id]
-        item.setText(0, f"{timestamp:.4f}")
-        item.setText(4, str(dlc))
-        
-        # Determine Byte Colors
+            node = self.model.add_message(can_id, self._ch_arr[index], name, signal_names, units)
+            self.message_items[can_id] = node
+
+        # Determine Byte States
         # Logic: 
         # Diff vs Prev:
         #   Changed -> Red (State 1)
@@ -248,113 +314,75 @@ class MainWindow(QMainWindow):
         #       If State was Red (1) -> Yellow (State 2)
         #       If State was Yellow (2) -> Yellow (State 2)
         #       If State was Gray (0) -> Gray (0)
+        # First sight of an ID has no previous bytes, so it stays Gray.
         
-        prev_data_str = self.last_data.get(can_id, "")
-        if len(prev_data_str) % 2 != 0: prev_data_str = "0" + prev_data_str
-        prev_bytes = [prev_data_str[i:i+2] for i in range(0, len(prev_data_str), 2)]
-        
-        # If prev is empty or length mismatch, treat all as new (Gray or Red? Let's say Gray for initial, Red if change detected from nothing? No, keep Gray for init)
-        # But if we are stepping, and this is the first time we see it, it is "new". 
-        # Standard: Gray.
-        
-        html_parts = []
-        states = self.byte_states[can_id]
-        
-        for i, byte_val in enumerate(current_bytes):
-            color = "#E0E0E0" # Light Gray (Default)
-            
-            # Check Change
-            changed = False
-            if i < len(prev_bytes):
-                if byte_val != prev_bytes[i]:
-                    changed = True
-            
-            if changed:
-                states[i] = 1 # Red
-                color = "#FF3333" # Red
-            else:
-                if states[i] == 1: # Was Red
-                    states[i] = 2 # Become Yellow
-                    color = "#FFFF33" # Yellow
-                elif states[i] == 2: # Was Yellow
-                    color = "#FFFF33" # Stay Yellow
-                else:
-                    color = "#E0E0E0" # Stay Gray
-
-            html_parts.append(f'<span style="color:{color}; font-family: monospace;">{byte_val}</span>')
-
-        # Update Message Label
-        lbl = self.tree.itemWidget(item, 5)
-        if lbl:
-            lbl.setText(" ".join(html_parts))
+        # Only bytes present in both frames can change (prev_dlc is 0 until seen)
+        changed = (current[:dlc] != self.prev_bytes[id_code, :dlc])
+        changed[self.prev_dlc[id_code]:] = False
+        states[:dlc] = STATE_NEXT[changed.view(np.uint8), states[:dlc]]
+
+        node = self.message_items[can_id]
+        node.timestamp = timestamp
+        node.dlc = dlc
+        node.data = current[:dlc].tobytes()
+        node.byte_states = states[:dlc].tolist()
+        self.model.message_changed(node)
         
-        self.last_data[can_id] = data_str
+        self.prev_bytes[id_code] = current
+        self.prev_dlc[id_code] = dlc
 
         # 2. Decode and Update Signals
-        if self.loader.db:
-            try:
-                data_bytes = bytes.fromhex(data_str)
-                msg_def = self.loader.db.get_message_by_frame_id(can_id)
-                decoded = msg_def.decode(data_bytes) # {name: value}
-                
-                for sig_name, val in decoded.items():
-                    key = (can_id, sig_name)
-                    if key in self.signal_items:
-                        s_item = self.signal_items[key]
-                        s_lbl = self.tree.itemWidget(s_item, 5)
-                        
-                        # Get unit
-                        unit = ""
-                        try:
-                            s_def = msg_def.get_signal_by_name(sig_name)
-                            if s_def.unit: unit = " " + s_def.unit
-                        except: pass
-                        
-                        new_text_val = f"{val}{unit}"
-                        old_val = self.last_signals.get(key)
-                        
-                        # Color Logic for Signal
-                        # 0=Gray, 1=Red, 2=Yellow
-                        s_state = self.signal_states.get(key, 0)
-                        s_color = "#E0E0E0"
-                        
-                        if old_val is not None and val != old_val:
-                            s_state = 1 # Red
-                            s_color = "#FF3333"
-                        else:
-                            if s_state == 1:
-                                s_state = 2 # Yellow
-                                s_color = "#FFFF33"
-                            elif s_state == 2:
-                                s_color = "#FFFF33"
-                            else:
-                                s_color = "#E0E0E0"
-                        
-                        self.signal_states[key] = s_state
-                        self.last_signals[key] = val
-                        
-                        if s_lbl:
-                            s_lbl.setText(f'<span style="color:{s_color}; font-family: monospace;">{new_text_val}</span>')
-
-            except Exception:
-                pass
+        if info:
+            decoded = self.loader.decode_payload(info['def'], node.data) # {name: value} or None
+
+            if decoded:
+                # Flat signal numbers of the decoded signals (a multiplexed
+                # message only decodes the signals of its current mux value)
+                signal_index = info['signal_index']
+                positions = [signal_index[name] for name in decoded]
+                values = list(decoded.values())
+                keys = self._sig_offset[id_code] + np.array(positions)
+
+                # Color Logic for Signal, same transitions as the bytes
+                # Choice values compare by their raw number
+                new = np.array([getattr(v, 'value', v) for v in values], dtype=np.float64)
+                old = self.last_signals[keys]
+                changed = (new != old) & ~np.isnan(old)
+                # float64 rounds integers past 53 bits; compare those signals exactly
+                if info['wide']:
+                    for j, k in enumerate(positions):
+                        if k in info['wide']:
+                            key = int(keys[j])
+                            raw = getattr(values[j], 'value', values[j])
+                            prev = self.last_wide.get(key)
+                            changed[j] = prev is not None and raw != prev
+                            self.last_wide[key] = raw
+                s_states = STATE_NEXT[changed.view(np.uint8), self.signal_states[keys]]
+                self.signal_states[keys] = s_states
+                self.last_signals[keys] = new
+
+                # Text is formatted by the model when the row is painted
+                for k, val, s_state in zip(positions, values, s_states.tolist()):
+                    node.signal_values[k] = val
+                    node.signal_states[k] = s_state
+
+                # Signal rows only need a repaint while visible
+                if node.children and self.tree.isExpanded(self.model.message_index(node)):
+                    self.model.signals_changed(node)
     
     def update_ui_common(self):
         """Updates common UI elements like slider, label, plot line."""
-        # Update Slider
-        self.slider.blockSignals(True)
-        self.slider.setValue(self.current_index)
-        self.slider.blockSignals(False)
+        # Update Slider (not while the user holds it; it already shows their position)
+        # The resulting valueChanged echo equals current_index and is ignored
+        if not self.slider.isSliderDown() and self.slider.sliderPosition() != self.current_index:
+            self.slider.setSliderPosition(self.current_index)
 
         # Update Time Label
-        timestamp = self.loader.df.iloc[self.current_index]['Timestamp']
+        timestamp = self._ts_arr[self.current_index]
         self.lbl_time.setText(f"Time: {timestamp:.4f} s")
         
         # Update Plot Line
-        for item in self.plot_widget.items():
-            if isinstance(item, pg.InfiniteLine):
-                self.plot_widget.removeItem(item)
-        self.plot_widget.addLine(x=timestamp, pen='r')
+        self.cursor_line.setPos(timestamp)
 
     def toggle_playback(self):
         if self.is_playing:
@@ -362,6 +390,8 @@ class MainWindow(QMainWindow):
             self.is_playing = False
             self.btn_play.setText("Play")
         else:
+            self._last_tick_wallclock = time.perf_counter()
+            self._play_credit = 0.0
             self.timer.start(self.timer_interval)
             self.is_playing = True
             self.btn_play.setText("Pause")
@@ -370,10 +400,23 @@ class MainWindow(QMainWindow):
         if self.loader.df.empty:
             return
         
-        if self.current_index < len(self.loader.df) - 1:
-            self.current_index += 1
-            self.process_frame(self.current_index)
-            self.update_ui_common()
+        # Catch up with the wall clock: one frame per timer_interval of real
+        # time (scaled by playback_speed), however late this tick fired.
+        # All due frames are processed, the UI is refreshed once.
+        now = time.perf_counter()
+        self._play_credit += (now - self._last_tick_wallclock) * 1000 * self.playback_speed / self.timer_interval
+        self._last_tick_wallclock = now
+        advance = int(self._play_credit)
+        self._play_credit -= advance
+
+        last = len(self.loader.df) - 1
+        if self.current_index < last:
+            end = min(self.current_index + advance, last)
+            for idx in range(self.current_index + 1, end + 1):
+                self.current_index = idx
+                self.process_frame(idx)
+            if advance:
+                self.update_ui_common()
         else:
             self.toggle_playback() # Stop at end
 
@@ -383,13 +426,38 @@ class MainWindow(QMainWindow):
             self.toggle_playback()
 
     def slider_released(self):
+        # Apply the last drag position right away
+        if self.seek_timer.isActive():
+            self.seek_timer.stop()
+            self._apply_seek()
         if hasattr(self, 'was_playing') and self.was_playing:
             self.toggle_playback()
 
     def slider_moved(self, val):
-        # Optimization: If val is just +1, use step.
-        if val == self.current_index + 1:
-            self.step_forward()
+        # Ignore stale queued positions and echoes of update_ui_common
+        if val != self.slider.value() or val == self.current_index:
+            return
+        self._pending_seek = val
+        if self.slider.isSliderDown():
+            # Dragging: intermediate positions are dropped until the timer fires
+            if not self.seek_timer.isActive():
+                self.seek_timer.start()
+            return
+        self.seek_timer.stop()
+        self._apply_seek()
+
+    def _apply_seek(self):
+        val = self._pending_seek
+        if val == self.current_index:
+            return
+
+        # Optimization: short forward moves (steps, forward drags) just replay
+        # the frames in between, which also keeps the change highlights.
+        if self.current_index < val <= self.current_index + SEEK_REPLAY_LIMIT:
+            for i in range(self.current_index + 1, val + 1):
+                self.process_frame(i)
+            self.current_index = val
+            self.update_ui_common()
             return
             
         self.current_index = val
@@ -400,32 +468,25 @@ class MainWindow(QMainWindow):
         # but that leaves other messages stale or missing.
         # Let's try to be correct first.
         
-        # Disable updates during bulk process
+        # Disable updates during bulk process; the model is rebuilt
+        # without per-row signals and the view reset once at the end
+        # (begin_batch empties it, so no model.clear() reset here)
         self.tree.setUpdatesEnabled(False)
-        self.tree.clear()
-        self.message_items = {}
-        self.signal_items = {}
-        self.last_data = {}
-        self.last_signals = {}
-        self.byte_states = {}
-        self.signal_states = {}
+        self.tree.blockSignals(True)
+        self.model.begin_batch()
+        self._reset_trace_arrays()
         
         # We need to find the latest occurrence of EACH unique ID up to index 'val'
         # Scanning 0..val is O(val).
-        # Optimization: Pandas allows us to get the latest indices per group efficiently!
-        
-        # Filter df up to current index
-        subset = self.loader.df.iloc[:val+1]
-        
-        # Group by ID and take the last occurrence
-        # This gives us the set of messages that should be visible and their last state.
-        latest_frames = subset.groupby('ID').tail(1)
+        # Optimization: the loader keeps sorted row positions per ID, so the
+        # latest one up to 'val' is a binary search per ID (no pandas groupby).
+        positions = self.loader.last_frame_positions(val)
         
         # Sort by timestamp to maintain relative order if desired, or just ID.
         # Trace windows usually sort by Timestamp of last event.
-        latest_frames = latest_frames.sort_values('Timestamp')
+        positions = positions[np.argsort(self._ts_arr[positions], kind='stable')]
         
-        for idx, row in latest_frames.iterrows():
+        for pos in positions:
             # We treat this as a "fresh" render for these rows (no highlight? or highlight vs nothing?)
             # Let's just render them. 
             # We call process_frame but that method assumes it's updating global state and highlighting.
@@ -436,52 +497,36 @@ class MainWindow(QMainWindow):
             # But process_frame does a lot of UI lookups.
             # Faster to loop locally.
             
-            # Actually, to properly populate self.last_data and items, we can just call process_frame 
-            # on these indices.
+            # Actually, to properly populate self.prev_bytes and items, we can just call process_frame 
+            # on these positions (plain row numbers, no index lookups).
             # But we must ensure self.message_items is populated.
-            self.process_frame(self.loader.df.index.get_loc(idx))
-            
-            # Reset highlights after seek?
-            # Usually when you seek, everything is "static". 
-            # Let's clear highlights (set everything to Gray 0 or Yellow 2 if we want to show it's 'state')
-            # Standard: Reset to Gray if we consider this the "starting point".
-            # If we want to show diff from PREVIOUS known state, we don't have that.
-            # So reset to Gray.
-            cid = row['ID']
-            if cid in self.byte_states:
-                self.byte_states[cid] = [0] * len(self.byte_states[cid])
-                # We need to re-render to apply Gray
-                # This is getting expensive. 
-                # Ideally process_frame handles it if we reset byte_states BEFORE calling it? 
-                # No, process_frame logic is "diff vs last_data". 
-                # Here last_data is empty initially.
-                # So process_frame sees "New" -> Default Gray.
-                # So we are good! Because we cleared self.last_data and self.byte_states.
-                pass
-
+            self.process_frame(int(pos))
+
+        # Highlights after seek: process_frame saw every ID as "New" (Gray),
+        # so replay all frames up to 'val' to get the byte states stepping
+        # from the start would have left. Signal highlights start Gray.
+        self.prev_bytes, self.prev_dlc, self.byte_states, _ = replay_byte_states(
+            self._data_arr, self._dlc_arr, self.loader.id_codes, val, len(self.loader.id_uniques))
+        for pos in positions:
+            node = self.message_items[int(self._id_arr[pos])]
+            node.byte_states = self.byte_states[self.loader.id_codes[pos], :node.dlc].tolist()
+
+        self.model.end_batch()
+        self.tree.blockSignals(False)
         self.tree.setUpdatesEnabled(True)
         self.update_ui_common()
 
-    def on_tree_click(self, item, col):
-        # Determine ID from the item
-        # Parent item (Message) or Child item (Signal)
-        
-        can_id_str = ""
+    def on_tree_click(self, index):
+        # Determine ID from the clicked row
+        # Parent row (Message) or Child row (Signal)
+        node = index.internalPointer()
         signal_name = None
         
-        if item.parent():
-            # Signal row
-            signal_name = item.text(3)
-            parent = item.parent()
-            can_id_str = parent.text(2)
+        if isinstance(node, SignalNode):
+            signal_name = node.name
+            can_id = node.parent.can_id
         else:
-            # Message row
-            can_id_str = item.text(2)
-            
-        try:
-            can_id = int(can_id_str, 16)
-        except:
-            return
+            can_id = node.can_id
 
         # Populate Combobox with signals for this ID
         signals = self.loader.get_signals_for_id(can_id)
@@ -510,29 +555,28 @@ class MainWindow(QMainWindow):
         if not text: return
         if self.current_index < 0 or self.current_index >= len(self.loader.df): return
         
-        can_id = self.loader.df.iloc[self.current_index]['ID']
+        can_id = int(self._id_arr[self.current_index])
         self.update_plot(can_id, text)
 
     def update_plot(self, can_id, signal_name):
-        self.plot_widget.clear()
-        
         if signal_name and "Raw ID" not in signal_name:
             times, values = self.loader.get_signal_trace(can_id, signal_name)
-            self.plot_widget.plot(times, values, pen='b', name=signal_name)
+            self.trace_curve.setData(times, values)
+            self.scatter_curve.setData([], [])
             self.plot_widget.setTitle(f"Signal: {signal_name}")
         else:
             # Fallback: Plot existence of ID (toggle) or just dots
             # Or similar to before, just plot ID value over time (constant line usually)
             # Better: Plot DLC or just tick marks
-            times = self.loader.df[self.loader.df['ID'] == can_id]['Timestamp']
-            y = [1] * len(times) # Just presence
-            self.plot_widget.plot(times, y, pen=None, symbol='o', symbolSize=5)
+            times = self._ts_arr[self._id_arr == can_id]
+            y = np.ones_like(times) # Just presence
+            self.trace_curve.setData([], [])
+            self.scatter_curve.setData(times, y)
             self.plot_widget.setTitle(f"Message Occurrences: 0x{can_id:X}")
 
-        # Add current time line
+        # Move current time line
         if not self.loader.df.empty:
-            current_time = self.loader.df.iloc[self.current_index]['Timestamp']
-            self.plot_widget.addLine(x=current_time, pen='r')
+            self.cursor_line.setPos(self._ts_arr[self.current_index])
 
 
 